@@ -3,144 +3,361 @@ Data Quality Validation Engine
 Executes YAML-defined rules and generates validation reports
 """
 
+import numpy as np
 import pandas as pd
 import yaml
 from pathlib import Path
 from datetime import datetime
 import argparse
+import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; fall back to vectorized NumPy
+    HAVE_NUMBA = False
+
+try:
+    import dask
+    import dask.dataframe as dd
+except ImportError:  # dask is optional; the default pandas engine needs neither
+    dask = None
+
+
+def _find_out_of_order(batch_codes, times_ns):
+    """
+    Return row indices where a timestamp goes backward within the same batch.
+    Inputs must already be sorted by (batch, process step); one linear pass.
+    """
+    if HAVE_NUMBA:
+        return _find_out_of_order_jit(batch_codes, times_ns)
+    mask = (batch_codes[1:] == batch_codes[:-1]) & (times_ns[1:] < times_ns[:-1])
+    return np.nonzero(mask)[0] + 1
+
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def _find_out_of_order_jit(batch_codes, times_ns):
+        out = np.empty(batch_codes.size, dtype=np.int64)
+        k = 0
+        for i in range(1, batch_codes.size):
+            if batch_codes[i] == batch_codes[i - 1] and times_ns[i] < times_ns[i - 1]:
+                out[k] = i
+                k += 1
+        return out[:k]
+
+
+class PreparedTable:
+    """
+    Thin wrapper around a loaded table that memoizes derived columns
+    (categorical codes, datetime views, boolean flags), so each heavy
+    transform happens once per run no matter how many rules consume it.
+    Column access passes through to the underlying DataFrame.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._cache = {}
+
+    def __getitem__(self, column):
+        return self.df[column]
+
+    def __len__(self):
+        return len(self.df)
+
+    def _memo(self, key, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def categorical(self, column):
+        """The column as a categorical Series"""
+        return self._memo(('categorical', column),
+                          lambda: self.df[column].astype('category'))
+
+    def codes(self, column):
+        """Integer category codes for the column"""
+        return self._memo(('codes', column),
+                          lambda: self.categorical(column).cat.codes.to_numpy())
+
+    def categories(self, column):
+        """Category values aligned with codes()"""
+        return self._memo(('categories', column),
+                          lambda: self.categorical(column).cat.categories.to_numpy())
+
+    def datetime_ns(self, column):
+        """The column as int64 nanoseconds, parsing strings only when needed"""
+        def build():
+            col = self.df[column]
+            if not pd.api.types.is_datetime64_any_dtype(col):
+                col = pd.to_datetime(col, cache=True)
+            return col.to_numpy(dtype='datetime64[ns]').view('int64')
+        return self._memo(('datetime_ns', column), build)
+
+    def equals(self, column, value):
+        """Boolean array marking rows where the column equals value"""
+        return self._memo(('equals', column, value),
+                          lambda: self.df[column].to_numpy() == value)
 
 
 class DataQualityChecker:
     """Execute data quality rules against manufacturing data"""
-    
-    def __init__(self, rules_path, data_dir):
+
+    # Columns the checks actually read, per table; projection pushdown means
+    # unused columns (bin_code, process_step_name, ...) never leave the Parquet file
+    TABLE_COLUMNS = {
+        'test_results': ['wafer_id', 'batch_id', 'process_step_id', 'start_time',
+                         'pass_fail', 'defect_density'],
+        'wafer_batches': ['batch_id', 'start_time', 'end_time'],
+        'equipment_logs': ['equipment_id', 'event_timestamp', 'status',
+                           'temperature_c', 'pressure_torr'],
+    }
+
+    # Explicit dtypes for the key/code columns: categoricals group and hash on
+    # integer codes and take a fraction of the memory of plain strings
+    TABLE_DTYPES = {
+        'test_results': {'batch_id': 'category', 'wafer_id': 'category',
+                         'pass_fail': pd.CategoricalDtype(['PASS', 'FAIL'])},
+        'wafer_batches': {'batch_id': 'category'},
+        'equipment_logs': {'equipment_id': 'category',
+                           'status': pd.CategoricalDtype(['RUNNING', 'IDLE', 'ALARM', 'DOWN'])},
+    }
+
+    def __init__(self, rules_path, data_dir, engine='pandas'):
+        if engine not in ('pandas', 'dask'):
+            raise ValueError(f"Unknown engine: {engine!r}")
+        if engine == 'dask' and dask is None:
+            raise ImportError("engine='dask' requires the dask[dataframe] package")
+        self.engine = engine
         self.rules_path = Path(rules_path)
         self.data_dir = Path(data_dir)
         self.rules = self._load_rules()
         self.results = defaultdict(list)
+        self._derived = {}
         
     def _load_rules(self):
         """Load DQ rules from YAML"""
         with open(self.rules_path, 'r') as f:
             config = yaml.safe_load(f)
-        return config['rules']
+        self.execution_config = config.get('execution_config', {})
+        rules = config['rules']
+        # Resolve each rule's handler ahead of time so the hot path is a
+        # single dict lookup instead of chained category/SQL substring probes
+        for rule in rules:
+            rule['_handler'] = self._classify_rule(rule)
+        return rules
     
     def _load_data(self, layer):
         """Load data from specified layer"""
         layer_dir = self.data_dir / layer
         
         data = {}
-        if layer_dir.exists():
+        if not layer_dir.exists():
+            return data
+
+        if self.engine == 'dask':
+            # Build every table's read lazily, then materialize them through a
+            # single dask.compute so the scheduler reads partitions in parallel
+            # and never holds more than the projected columns. Rules still run
+            # on in-memory frames; only ingest is out-of-core.
+            lazy = {
+                parquet_file.stem: dd.read_parquet(
+                    parquet_file, columns=self.TABLE_COLUMNS.get(parquet_file.stem))
+                for parquet_file in layer_dir.glob('*.parquet')
+            }
+            for table_name, df in zip(lazy, dask.compute(*lazy.values())):
+                data[table_name] = PreparedTable(df.astype(self.TABLE_DTYPES.get(table_name, {})))
+                print(f"  Loaded {table_name}: {len(data[table_name]):,} rows")
+            return data
+
+        for parquet_file in layer_dir.glob('*.parquet'):
+            table_name = parquet_file.stem
+            df = pd.read_parquet(
+                parquet_file, columns=self.TABLE_COLUMNS.get(table_name),
+                dtype_backend='pyarrow')
+            data[table_name] = PreparedTable(df.astype(self.TABLE_DTYPES.get(table_name, {})))
+            print(f"  Loaded {table_name}: {len(data[table_name]):,} rows")
+
+        if not data:
+            # Fall back to CSVs from older pipeline runs; the pyarrow engine
+            # with an explicit schema skips the dtype-inference pass
             for csv_file in layer_dir.glob('*.csv'):
                 table_name = csv_file.stem
-                data[table_name] = pd.read_csv(csv_file)
+                data[table_name] = PreparedTable(pd.read_csv(
+                    csv_file, engine='pyarrow',
+                    usecols=self.TABLE_COLUMNS.get(table_name),
+                    dtype=self.TABLE_DTYPES.get(table_name)))
                 print(f"  Loaded {table_name}: {len(data[table_name]):,} rows")
-        
+
         return data
-    
-    def _execute_pandas_check(self, rule, data):
+
+    def _prepare_derived(self, data):
+        """
+        Precompute frames shared by multiple rules, keyed by (table, op).
+        Each expensive scan (groupby, datetime parse, sort) happens once per
+        run instead of once per rule that needs it.
+        """
+        self._derived = {}
+
+        if 'test_results' in data:
+            tests = data['test_results']
+
+            # Batch-level yield, shared by the RANGE yield rules. A boolean
+            # mean over categorical keys stays on the Cython groupby path,
+            # unlike a per-group Python lambda.
+            batch_yield = (
+                pd.DataFrame({
+                    'batch_id': tests.categorical('batch_id'),
+                    'is_pass': tests.equals('pass_fail', 'PASS'),
+                })
+                .groupby('batch_id', sort=False, observed=True)['is_pass']
+                .mean().mul(100).rename('yield_pct').reset_index()
+            )
+            self._derived[('test_results', 'batch_yield')] = batch_yield
+
+            # Step-ordered arrays for TEMPORAL rules: categorical batch codes
+            # plus int64 nanosecond timestamps, sorted once via lexsort
+            codes = tests.codes('batch_id')
+            times_ns = tests.datetime_ns('start_time')
+            step_order = np.lexsort((tests['process_step_id'].to_numpy(), codes))
+            self._derived[('test_results', 'step_sorted_codes')] = codes[step_order]
+            self._derived[('test_results', 'step_sorted_ns')] = times_ns[step_order]
+            self._derived[('test_results', 'batch_categories')] = tests.categories('batch_id')
+
+    def _classify_rule(self, rule):
         """
-        Execute DQ rule using pandas (simplified SQL-to-pandas translation)
-        In production, this would use actual SQL against a database
+        Resolve a rule to its handler once, at load time (simplified
+        SQL-to-pandas translation; in production this would parse the SQL).
+        Returns None when the rule has no pandas implementation.
         """
+        category, check_sql = rule['category'], rule['check_sql']
+
+        if category == 'REFERENTIAL_INTEGRITY':
+            if 'wafer_tests' in check_sql and 'wafer_batches' in check_sql:
+                return self._check_wafer_batch_integrity
+
+        elif category == 'RANGE':
+            if 'yield_pct' in check_sql:
+                return self._check_yield_range
+            if 'defect_density' in check_sql:
+                return self._check_defect_density
+            if 'temperature' in check_sql:
+                return self._check_temperature_range
+            if 'pressure' in check_sql:
+                return self._check_pressure_range
+
+        elif category == 'COMPLETENESS':
+            if 'wafer_id' in check_sql:
+                return self._check_wafer_id_not_null
+            if 'equipment_id' in check_sql:
+                return self._check_equipment_id_not_null
+            if 'pass_fail' in check_sql:
+                return self._check_pass_fail_domain
+
+        elif category == 'UNIQUENESS':
+            if 'wafer_id' in check_sql and 'batch_id' in check_sql:
+                return self._check_wafer_uniqueness
+
+        elif category == 'TEMPORAL':
+            if 'Process Step Sequence' in rule['name']:
+                return self._check_step_sequence
+
+        return None
+
+    # Each handler returns (violations, violation_details)
+
+    def _check_wafer_batch_integrity(self, data):
+        """Wafer-to-batch integrity: a membership test finds orphans without a merge"""
+        if 'test_results' not in data or 'wafer_batches' not in data:
+            return 0, []
+        tests = data['test_results']
+        orphan_mask = ~tests['batch_id'].isin(data['wafer_batches']['batch_id'])
+        violations = int(orphan_mask.sum())
+        return violations, pd.unique(tests.df.loc[orphan_mask, 'batch_id'])[:10].tolist()
+
+    def _check_yield_range(self, data):
+        """Yield percentage bounds (batch-level yield is precomputed)"""
+        if ('test_results', 'batch_yield') not in self._derived:
+            return 0, []
+        batch_yield = self._derived[('test_results', 'batch_yield')]
+        invalid_yield = batch_yield[(batch_yield['yield_pct'] < 0) | (batch_yield['yield_pct'] > 100)]
+        return len(invalid_yield), invalid_yield['batch_id'].tolist()[:10]
+
+    def _check_defect_density(self, data):
+        """Defect density must be non-negative"""
+        if 'test_results' not in data:
+            return 0, []
+        tests = data['test_results']
+        mask = tests['defect_density'].to_numpy() < 0
+        return int(mask.sum()), tests['wafer_id'].to_numpy()[mask][:10].tolist()
+
+    def _check_temperature_range(self, data):
+        """Equipment temperature within operational bounds"""
+        if 'equipment_logs' not in data:
+            return 0, []
+        logs = data['equipment_logs']
+        temperature = logs['temperature_c'].to_numpy()
+        mask = (temperature < -50) | (temperature > 500)
+        return int(mask.sum()), pd.unique(logs['equipment_id'].to_numpy()[mask])[:10].tolist()
+
+    def _check_pressure_range(self, data):
+        """Chamber pressure within realistic bounds"""
+        if 'equipment_logs' not in data:
+            return 0, []
+        pressure = data['equipment_logs']['pressure_torr'].to_numpy()
+        return int(((pressure < 0.001) | (pressure > 1000)).sum()), []
+
+    def _check_wafer_id_not_null(self, data):
+        """Every test record must have a wafer_id"""
+        if 'test_results' not in data:
+            return 0, []
+        col = data['test_results']['wafer_id']
+        return int((col.isna() | (col.str.len() == 0)).sum()), []
+
+    def _check_equipment_id_not_null(self, data):
+        """Equipment logs must have an equipment_id"""
+        if 'equipment_logs' not in data:
+            return 0, []
+        col = data['equipment_logs']['equipment_id']
+        return int((col.isna() | (col.str.len() == 0)).sum()), []
+
+    def _check_pass_fail_domain(self, data):
+        """pass_fail must be present and within its domain"""
+        if 'test_results' not in data:
+            return 0, []
+        col = data['test_results']['pass_fail']
+        return int((col.isna() | ~col.isin(['PASS', 'FAIL'])).sum()), []
+
+    def _check_wafer_uniqueness(self, data):
+        """Wafer ids must be unique within a batch"""
+        if 'test_results' not in data:
+            return 0, []
+        tests = data['test_results']
+        # duplicated() yields the mask directly; only the (small) set of
+        # surplus rows is then deduplicated to count keys
+        surplus = tests.df.duplicated(subset=['batch_id', 'wafer_id'])
+        dup_keys = tests.df.loc[surplus, ['batch_id', 'wafer_id']].drop_duplicates()
+        return len(dup_keys), dup_keys['wafer_id'].tolist()[:10]
+
+    def _check_step_sequence(self, data):
+        """Process steps in order: one compiled pass over presorted arrays"""
+        if ('test_results', 'step_sorted_codes') not in self._derived:
+            return 0, []
+        codes = self._derived[('test_results', 'step_sorted_codes')]
+        times_ns = self._derived[('test_results', 'step_sorted_ns')]
+        bad_idx = _find_out_of_order(codes, times_ns)
+        categories = self._derived[('test_results', 'batch_categories')]
+        return len(bad_idx), pd.unique(categories[codes[bad_idx]])[:10].tolist()
+
+    def _execute_pandas_check(self, rule, data):
+        """Execute a DQ rule through its precomputed handler"""
+        handler = rule.get('_handler')
+        if handler is None:
+            return 0, []
         try:
-            # This is a simplified implementation
-            # In production, you'd execute actual SQL queries
-            
-            violations = 0
-            violation_details = []
-            
-            # Map SQL table names to loaded dataframes
-            # This is a placeholder - real implementation would parse SQL
-            
-            if rule['category'] == 'REFERENTIAL_INTEGRITY':
-                if 'wafer_tests' in rule['check_sql'] and 'wafer_batches' in rule['check_sql']:
-                    if 'wafer_tests' in data and 'wafer_batches' in data:
-                        # Check wafer-to-batch integrity
-                        tests = data['test_results']
-                        batches = data['wafer_batches']
-                        
-                        merged = tests.merge(batches, on='batch_id', how='left', indicator=True)
-                        violations = len(merged[merged['_merge'] == 'left_only'])
-                        violation_details = merged[merged['_merge'] == 'left_only']['batch_id'].unique().tolist()[:10]
-            
-            elif rule['category'] == 'RANGE':
-                if 'yield_pct' in rule['check_sql']:
-                    # Check yield percentage bounds
-                    if 'test_results' in data:
-                        tests = data['test_results']
-                        # Calculate batch-level yield
-                        batch_yield = tests.groupby('batch_id').agg({
-                            'pass_fail': lambda x: (x == 'PASS').sum() / len(x) * 100
-                        }).reset_index()
-                        batch_yield.columns = ['batch_id', 'yield_pct']
-                        
-                        invalid_yield = batch_yield[(batch_yield['yield_pct'] < 0) | (batch_yield['yield_pct'] > 100)]
-                        violations = len(invalid_yield)
-                        violation_details = invalid_yield['batch_id'].tolist()[:10]
-                
-                elif 'defect_density' in rule['check_sql']:
-                    if 'test_results' in data:
-                        tests = data['test_results']
-                        invalid = tests[tests['defect_density'] < 0]
-                        violations = len(invalid)
-                        violation_details = invalid['wafer_id'].tolist()[:10]
-                
-                elif 'temperature' in rule['check_sql']:
-                    if 'equipment_logs' in data:
-                        logs = data['equipment_logs']
-                        invalid = logs[(logs['temperature_c'] < -50) | (logs['temperature_c'] > 500)]
-                        violations = len(invalid)
-                        violation_details = invalid['equipment_id'].unique().tolist()[:10]
-                
-                elif 'pressure' in rule['check_sql']:
-                    if 'equipment_logs' in data:
-                        logs = data['equipment_logs']
-                        invalid = logs[(logs['pressure_torr'] < 0.001) | (logs['pressure_torr'] > 1000)]
-                        violations = len(invalid)
-            
-            elif rule['category'] == 'COMPLETENESS':
-                if 'wafer_id' in rule['check_sql']:
-                    if 'test_results' in data:
-                        tests = data['test_results']
-                        violations = tests['wafer_id'].isna().sum() + (tests['wafer_id'] == '').sum()
-                
-                elif 'equipment_id' in rule['check_sql']:
-                    if 'equipment_logs' in data:
-                        logs = data['equipment_logs']
-                        violations = logs['equipment_id'].isna().sum() + (logs['equipment_id'] == '').sum()
-                
-                elif 'pass_fail' in rule['check_sql']:
-                    if 'test_results' in data:
-                        tests = data['test_results']
-                        violations = tests['pass_fail'].isna().sum()
-                        violations += len(tests[~tests['pass_fail'].isin(['PASS', 'FAIL'])])
-            
-            elif rule['category'] == 'UNIQUENESS':
-                if 'wafer_id' in rule['check_sql'] and 'batch_id' in rule['check_sql']:
-                    if 'test_results' in data:
-                        tests = data['test_results']
-                        duplicates = tests.groupby(['batch_id', 'wafer_id']).size().reset_index(name='count')
-                        duplicates = duplicates[duplicates['count'] > 1]
-                        violations = len(duplicates)
-                        violation_details = duplicates['wafer_id'].tolist()[:10]
-            
-            elif rule['category'] == 'TEMPORAL':
-                if 'test_results' in data and 'Process Step Sequence' in rule['name']:
-                    tests = data['test_results']
-                    # Check if process steps are in order
-                    tests_sorted = tests.sort_values(['batch_id', 'process_step_id'])
-                    tests_sorted['prev_time'] = tests_sorted.groupby('batch_id')['start_time'].shift(1)
-                    tests_sorted['start_time'] = pd.to_datetime(tests_sorted['start_time'])
-                    tests_sorted['prev_time'] = pd.to_datetime(tests_sorted['prev_time'])
-                    
-                    invalid = tests_sorted[tests_sorted['start_time'] < tests_sorted['prev_time']].dropna()
-                    violations = len(invalid)
-                    violation_details = invalid['batch_id'].unique().tolist()[:10]
-            
-            return violations, violation_details
-            
+            return handler(data)
         except Exception as e:
             print(f"  ⚠️  Error executing rule {rule['rule_id']}: {str(e)}")
             return -1, [f"Error: {str(e)}"]
@@ -194,26 +411,32 @@ class DataQualityChecker:
             return
         
         print(f"✓ Loaded {len(data)} tables\n")
-        
+
+        # Precompute frames shared across rules
+        self._prepare_derived(data)
+
         # Execute rules
         print("Executing validation rules...\n")
         
-        results = []
-        for rule in self.rules:
-            if layer in rule.get('layer', 'staging'):
-                print(f"  [{rule['rule_id']}] {rule['name']}...", end=' ')
-                result = self.check_rule(rule, data)
-                results.append(result)
-                
-                # Print result
-                if result['status'] == 'PASS':
-                    print("✅ PASS")
-                elif result['status'] == 'WARNING':
-                    print(f"⚠️  WARNING ({result['violations']} violations)")
-                elif result['status'] == 'FAIL':
-                    print(f"❌ FAIL ({result['violations']} violations)")
-                else:
-                    print("⚡ ERROR")
+        # Rules only read from data/_derived, so they can run concurrently
+        # with no locking; GIL-releasing pandas/NumPy kernels overlap.
+        layer_rules = [rule for rule in self.rules if layer in rule.get('layer', 'staging')]
+        max_workers = self.execution_config.get('max_parallel_checks') or os.cpu_count()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.check_rule, rule, data) for rule in layer_rules]
+            results = [future.result() for future in futures]  # keeps rule order
+
+        for result in results:
+            print(f"  [{result['rule_id']}] {result['rule_name']}...", end=' ')
+            if result['status'] == 'PASS':
+                print("✅ PASS")
+            elif result['status'] == 'WARNING':
+                print(f"⚠️  WARNING ({result['violations']} violations)")
+            elif result['status'] == 'FAIL':
+                print(f"❌ FAIL ({result['violations']} violations)")
+            else:
+                print("⚡ ERROR")
         
         self.results[layer] = results
         
@@ -224,94 +447,100 @@ class DataQualityChecker:
     
     def _print_summary(self, results):
         """Print DQ check summary"""
-        print(f"\n{'='*70}")
-        print("Data Quality Summary")
-        print(f"{'='*70}\n")
-        
         passed = len([r for r in results if r['status'] == 'PASS'])
         warnings = len([r for r in results if r['status'] == 'WARNING'])
         failed = len([r for r in results if r['status'] == 'FAIL'])
         errors = len([r for r in results if r['status'] == 'ERROR'])
-        
-        print(f"✅ Passed:   {passed:3d}")
-        print(f"⚠️  Warnings: {warnings:3d}")
-        print(f"❌ Failed:   {failed:3d}")
-        print(f"⚡ Errors:   {errors:3d}")
-        print(f"{'─'*70}")
-        print(f"   Total:    {len(results):3d}\n")
-        
+
+        # Collect everything and print once
+        lines = [
+            f"\n{'='*70}",
+            "Data Quality Summary",
+            f"{'='*70}\n",
+            f"✅ Passed:   {passed:3d}",
+            f"⚠️  Warnings: {warnings:3d}",
+            f"❌ Failed:   {failed:3d}",
+            f"⚡ Errors:   {errors:3d}",
+            f"{'─'*70}",
+            f"   Total:    {len(results):3d}\n",
+        ]
+
         # Show failures and warnings
         if failed > 0:
-            print("CRITICAL FAILURES:")
-            print(f"{'─'*70}")
+            lines.append("CRITICAL FAILURES:")
+            lines.append(f"{'─'*70}")
             for r in [x for x in results if x['status'] == 'FAIL']:
-                print(f"\n[{r['rule_id']}] {r['rule_name']} - {r['severity']}")
-                print(f"  Violations: {r['violations']} (threshold: {r['threshold']})")
-                print(f"  Impact: {r['impact']}")
+                lines.append(f"\n[{r['rule_id']}] {r['rule_name']} - {r['severity']}")
+                lines.append(f"  Violations: {r['violations']} (threshold: {r['threshold']})")
+                lines.append(f"  Impact: {r['impact']}")
                 if r['details']:
-                    print(f"  Examples: {', '.join(map(str, r['details'][:3]))}")
-        
+                    lines.append(f"  Examples: {', '.join(map(str, r['details'][:3]))}")
+
         if warnings > 0:
-            print(f"\n{'─'*70}")
-            print("WARNINGS:")
-            print(f"{'─'*70}")
+            lines.append(f"\n{'─'*70}")
+            lines.append("WARNINGS:")
+            lines.append(f"{'─'*70}")
             for r in [x for x in results if x['status'] == 'WARNING']:
-                print(f"\n[{r['rule_id']}] {r['rule_name']}")
-                print(f"  Violations: {r['violations']} (threshold: {r['threshold']})")
-                print(f"  Impact: {r['impact']}")
-        
-        print(f"\n{'='*70}\n")
+                lines.append(f"\n[{r['rule_id']}] {r['rule_name']}")
+                lines.append(f"  Violations: {r['violations']} (threshold: {r['threshold']})")
+                lines.append(f"  Impact: {r['impact']}")
+
+        lines.append(f"\n{'='*70}\n")
+        print("\n".join(lines))
     
     def generate_report(self, output_path='dq/dq_report.md'):
         """Generate markdown DQ report"""
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            f.write("# Data Quality Validation Report\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"**Data Directory:** {self.data_dir}\n\n")
-            f.write("---\n\n")
-            
-            for layer, results in self.results.items():
-                f.write(f"## Layer: {layer}\n\n")
-                
-                # Summary table
-                passed = len([r for r in results if r['status'] == 'PASS'])
-                warnings = len([r for r in results if r['status'] == 'WARNING'])
-                failed = len([r for r in results if r['status'] == 'FAIL'])
-                
-                f.write(f"| Status | Count |\n")
-                f.write(f"|--------|-------|\n")
-                f.write(f"| ✅ Passed | {passed} |\n")
-                f.write(f"| ⚠️ Warnings | {warnings} |\n")
-                f.write(f"| ❌ Failed | {failed} |\n\n")
-                
-                # Detailed results
-                f.write("### Detailed Results\n\n")
-                
-                for r in results:
-                    status_icon = {
-                        'PASS': '✅',
-                        'WARNING': '⚠️',
-                        'FAIL': '❌',
-                        'ERROR': '⚡'
-                    }.get(r['status'], '❓')
-                    
-                    f.write(f"#### {status_icon} [{r['rule_id']}] {r['rule_name']}\n\n")
-                    f.write(f"- **Category:** {r['category']}\n")
-                    f.write(f"- **Severity:** {r['severity']}\n")
-                    f.write(f"- **Status:** {r['status']}\n")
-                    f.write(f"- **Violations:** {r['violations']} (threshold: {r['threshold']})\n")
-                    f.write(f"- **Impact:** {r['impact']}\n")
-                    
-                    if r['details']:
-                        f.write(f"- **Examples:** {', '.join(map(str, r['details']))}\n")
-                    
-                    f.write("\n")
-                
-                f.write("---\n\n")
-        
+        # Assemble the whole report in memory and write it in one call
+        parts = []
+        parts.append("# Data Quality Validation Report\n\n")
+        parts.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        parts.append(f"**Data Directory:** {self.data_dir}\n\n")
+        parts.append("---\n\n")
+
+        for layer, results in self.results.items():
+            parts.append(f"## Layer: {layer}\n\n")
+
+            # Summary table
+            passed = len([r for r in results if r['status'] == 'PASS'])
+            warnings = len([r for r in results if r['status'] == 'WARNING'])
+            failed = len([r for r in results if r['status'] == 'FAIL'])
+
+            parts.append(f"| Status | Count |\n")
+            parts.append(f"|--------|-------|\n")
+            parts.append(f"| ✅ Passed | {passed} |\n")
+            parts.append(f"| ⚠️ Warnings | {warnings} |\n")
+            parts.append(f"| ❌ Failed | {failed} |\n\n")
+
+            # Detailed results
+            parts.append("### Detailed Results\n\n")
+
+            for r in results:
+                status_icon = {
+                    'PASS': '✅',
+                    'WARNING': '⚠️',
+                    'FAIL': '❌',
+                    'ERROR': '⚡'
+                }.get(r['status'], '❓')
+
+                parts.append(f"#### {status_icon} [{r['rule_id']}] {r['rule_name']}\n\n")
+                parts.append(f"- **Category:** {r['category']}\n")
+                parts.append(f"- **Severity:** {r['severity']}\n")
+                parts.append(f"- **Status:** {r['status']}\n")
+                parts.append(f"- **Violations:** {r['violations']} (threshold: {r['threshold']})\n")
+                parts.append(f"- **Impact:** {r['impact']}\n")
+
+                if r['details']:
+                    parts.append(f"- **Examples:** {', '.join(map(str, r['details']))}\n")
+
+                parts.append("\n")
+
+            parts.append("---\n\n")
+
+        output_path.write_text("".join(parts))
+
         print(f"✅ DQ Report generated: {output_path}\n")
 
 
@@ -326,10 +555,13 @@ def main():
                         help='Data layer to validate')
     parser.add_argument('--report', action='store_true',
                         help='Generate markdown report')
-    
+    parser.add_argument('--engine', type=str, default='pandas',
+                        choices=['pandas', 'dask'],
+                        help='Data loading engine (dask enables out-of-core ingest)')
+
     args = parser.parse_args()
-    
-    checker = DataQualityChecker(args.rules, args.data_dir)
+
+    checker = DataQualityChecker(args.rules, args.data_dir, engine=args.engine)
     checker.run_checks(layer=args.layer)
     
     if args.report:
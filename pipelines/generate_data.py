@@ -10,8 +10,6 @@ import argparse
 import os
 from pathlib import Path
 
-# Set random seed for reproducibility
-np.random.seed(42)
 
 class SemiconductorDataGenerator:
     """Generate realistic semiconductor manufacturing data"""
@@ -21,6 +19,7 @@ class SemiconductorDataGenerator:
         self.days = days
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / 'raw').mkdir(exist_ok=True)
         
         # Manufacturing constants
         self.EQUIPMENT_TYPES = ['ETCH', 'LITHO', 'IMPLANT', 'CVD', 'PVD', 'CMP', 'TEST']
@@ -34,76 +33,106 @@ class SemiconductorDataGenerator:
         ]
         self.WAFERS_PER_BATCH = 25
         self.BATCHES_PER_DAY = 20
-        
+
+        # Sensor profiles per equipment type: (temp_mean, temp_std, pressure_mean, pressure_std)
+        self.SENSOR_PROFILES = {
+            'ETCH': (250, 10, 0.1, 0.02),
+            'LITHO': (23, 2, 1.0, 0.1),
+            'CVD': (400, 20, 5.0, 0.5)
+        }
+        self.DEFAULT_SENSOR_PROFILE = (100, 15, 1.0, 0.2)
+
+        # Single seeded Generator instance for reproducibility (faster than
+        # legacy np.random.* and supports batched draws)
+        self.rng = np.random.default_rng(42)
+
         # Equipment inventory
         self.equipment = self._generate_equipment_inventory()
         
     def _generate_equipment_inventory(self):
         """Create equipment master data"""
+        tool_counts = self.rng.integers(3, 8, size=len(self.EQUIPMENT_TYPES))  # 3-7 tools per type
+        total_tools = int(tool_counts.sum())
+        manufacturers = self.rng.choice(['Applied Materials', 'Lam Research', 'ASML', 'KLA'], size=total_tools)
+        ages_days = self.rng.integers(365, 1825, size=total_tools)  # 1-5 years old
+
         equipment_list = []
-        for eq_type in self.EQUIPMENT_TYPES:
-            num_tools = np.random.randint(3, 8)  # 3-7 tools per type
+        tool_idx = 0
+        for eq_type, num_tools in zip(self.EQUIPMENT_TYPES, tool_counts):
             for i in range(num_tools):
                 equipment_list.append({
                     'equipment_id': f"{eq_type[:3]}{i+1:03d}",
                     'equipment_type': eq_type,
-                    'manufacturer': np.random.choice(['Applied Materials', 'Lam Research', 'ASML', 'KLA']),
-                    'install_date': self.start_date - timedelta(days=np.random.randint(365, 1825)),  # 1-5 years old
+                    'manufacturer': manufacturers[tool_idx],
+                    'install_date': self.start_date - timedelta(days=int(ages_days[tool_idx])),
                     'status': 'ACTIVE'
                 })
-        return pd.DataFrame(equipment_list)
+                tool_idx += 1
+        df = pd.DataFrame(equipment_list)
+        df['equipment_type'] = pd.Categorical(df['equipment_type'], categories=self.EQUIPMENT_TYPES)
+
+        # Id pools per type, built once so downstream generators never have to
+        # re-filter the inventory frame
+        self._equipment_by_type = {
+            t: df.loc[df['equipment_type'] == t, 'equipment_id'].to_numpy()
+            for t in self.EQUIPMENT_TYPES
+        }
+        return df
     
     def generate_equipment_logs(self):
         """Generate equipment sensor logs"""
         print("Generating equipment logs...")
-        
-        all_logs = []
-        current_time = self.start_date
-        end_time = self.start_date + timedelta(days=self.days)
-        
-        # For each equipment, generate status changes and sensor readings
-        for _, eq in self.equipment.iterrows():
-            eq_time = current_time
-            
+
+        start_time = np.datetime64(self.start_date)
+        total_minutes = self.days * 24 * 60
+
+        # Structure-of-Arrays: per-equipment column arrays, concatenated once at the end
+        columns = {name: [] for name in ['equipment_id', 'event_timestamp', 'status',
+                                         'temperature_c', 'pressure_torr', 'rf_power_w',
+                                         'ingestion_timestamp']}
+
+        # For each equipment, generate status changes and sensor readings.
+        # itertuples avoids boxing every inventory row into a Series.
+        for eq in self.equipment.itertuples(index=False):
             # Equipment degradation factor (older equipment has more variability)
-            age_days = (current_time - eq['install_date']).days
+            age_days = (self.start_date - eq.install_date).days
             degradation_factor = 1 + (age_days / 1825) * 0.1  # 10% degradation over 5 years
-            
-            while eq_time < end_time:
-                # Equipment operates in cycles
-                cycle_duration = np.random.randint(60, 240)  # 1-4 hours
-                status = np.random.choice(['RUNNING', 'IDLE', 'ALARM', 'DOWN'], p=[0.70, 0.20, 0.08, 0.02])
-                
-                # Generate sensor readings based on equipment type
-                if eq['equipment_type'] == 'ETCH':
-                    temperature = np.random.normal(250, 10 * degradation_factor)
-                    pressure = np.random.normal(0.1, 0.02 * degradation_factor)
-                elif eq['equipment_type'] == 'LITHO':
-                    temperature = np.random.normal(23, 2 * degradation_factor)
-                    pressure = np.random.normal(1.0, 0.1 * degradation_factor)
-                elif eq['equipment_type'] == 'CVD':
-                    temperature = np.random.normal(400, 20 * degradation_factor)
-                    pressure = np.random.normal(5.0, 0.5 * degradation_factor)
-                else:
-                    temperature = np.random.normal(100, 15 * degradation_factor)
-                    pressure = np.random.normal(1.0, 0.2 * degradation_factor)
-                
-                all_logs.append({
-                    'equipment_id': eq['equipment_id'],
-                    'event_timestamp': eq_time,
-                    'status': status,
-                    'temperature_c': round(temperature, 2),
-                    'pressure_torr': round(pressure, 3),
-                    'rf_power_w': round(np.random.normal(1500, 100), 1) if eq['equipment_type'] in ['ETCH', 'CVD'] else None,
-                    'ingestion_timestamp': eq_time + timedelta(seconds=np.random.randint(1, 300))  # Some latency
-                })
-                
-                eq_time += timedelta(minutes=cycle_duration)
-        
-        df = pd.DataFrame(all_logs)
-        output_path = self.output_dir / 'raw' / 'equipment_logs.csv'
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(output_path, index=False)
+
+            # Draw all cycle durations up front (1-4 hours each, 60 min minimum
+            # bounds the cycle count), then keep the cycles that start in-window
+            max_cycles = total_minutes // 60 + 1
+            cycle_durations = self.rng.integers(60, 240, size=max_cycles)
+            start_offsets = np.concatenate(([0], np.cumsum(cycle_durations[:-1])))
+            n = int(np.searchsorted(start_offsets, total_minutes))
+
+            timestamps = (start_time + start_offsets[:n].astype('timedelta64[m]')).astype('datetime64[ns]')
+            status = self.rng.choice(['RUNNING', 'IDLE', 'ALARM', 'DOWN'], size=n, p=[0.70, 0.20, 0.08, 0.02])
+
+            # Sensor readings drawn in one shot per equipment
+            temp_mean, temp_std, pres_mean, pres_std = self.SENSOR_PROFILES.get(
+                eq.equipment_type, self.DEFAULT_SENSOR_PROFILE)
+            temperature = self.rng.normal(temp_mean, temp_std * degradation_factor, size=n).round(2)
+            pressure = self.rng.normal(pres_mean, pres_std * degradation_factor, size=n).round(3)
+
+            if eq.equipment_type in ['ETCH', 'CVD']:
+                rf_power = self.rng.normal(1500, 100, size=n).round(1)
+            else:
+                rf_power = np.full(n, np.nan)
+
+            # Ingestion lags the event by up to 5 minutes
+            ingestion = timestamps + self.rng.integers(1, 300, size=n).astype('timedelta64[s]')
+
+            columns['equipment_id'].append(np.repeat(eq.equipment_id, n))
+            columns['event_timestamp'].append(timestamps)
+            columns['status'].append(status)
+            columns['temperature_c'].append(temperature)
+            columns['pressure_torr'].append(pressure)
+            columns['rf_power_w'].append(rf_power)
+            columns['ingestion_timestamp'].append(ingestion)
+
+        df = pd.DataFrame({name: np.concatenate(parts) for name, parts in columns.items()})
+        output_path = self.output_dir / 'raw' / 'equipment_logs.parquet'
+        df.to_parquet(output_path, compression='snappy')
         print(f"✓ Generated {len(df):,} equipment log records → {output_path}")
         return df
     
@@ -111,40 +140,41 @@ class SemiconductorDataGenerator:
         """Generate wafer batch data"""
         print("Generating wafer batches...")
         
-        batches = []
-        batch_id = 1
-        current_date = self.start_date
-        end_date = self.start_date + timedelta(days=self.days)
-        
-        while current_date < end_date:
-            for _ in range(self.BATCHES_PER_DAY):
-                # Select equipment for this batch (one per process step)
-                batch_equipment = {}
-                for step in self.PROCESS_STEPS:
-                    available_eq = self.equipment[self.equipment['equipment_type'] == step['equipment_type']]
-                    batch_equipment[step['step_id']] = available_eq.sample(1).iloc[0]['equipment_id']
-                
-                batch_start = current_date + timedelta(hours=np.random.randint(0, 24))
-                total_duration = sum([s['duration_min'] for s in self.PROCESS_STEPS])
-                batch_end = batch_start + timedelta(minutes=total_duration) + timedelta(minutes=np.random.randint(-20, 60))
-                
-                batches.append({
-                    'batch_id': f"B{batch_id:06d}",
-                    'lot_number': f"LOT_{current_date.year}_{batch_id:04d}",
-                    'recipe': np.random.choice(['CMOS_28nm_v3', 'FinFET_14nm_v2', 'GAA_7nm_v1']),
-                    'start_time': batch_start,
-                    'end_time': batch_end,
-                    'equipment_sequence': ','.join([batch_equipment[s['step_id']] for s in self.PROCESS_STEPS]),
-                    'wafer_count': self.WAFERS_PER_BATCH
-                })
-                
-                batch_id += 1
-            
-            current_date += timedelta(days=1)
-        
-        df = pd.DataFrame(batches)
-        output_path = self.output_dir / 'raw' / 'wafer_batches.csv'
-        df.to_csv(output_path, index=False)
+        n_batches = self.days * self.BATCHES_PER_DAY
+
+        # Selecting equipment for every batch is a single integer draw per
+        # process step into the prebuilt per-type id pools
+        step_equipment = []
+        for step in self.PROCESS_STEPS:
+            pool = self._equipment_by_type[step['equipment_type']]
+            step_equipment.append(pool[self.rng.integers(0, len(pool), size=n_batches)])
+
+        # Column-wise comma join of the per-step id arrays (no per-batch Python join)
+        equipment_sequence = step_equipment[0]
+        for step_ids in step_equipment[1:]:
+            equipment_sequence = np.char.add(np.char.add(equipment_sequence, ','), step_ids)
+
+        batch_dates = np.datetime64(self.start_date) + np.repeat(
+            np.arange(self.days), self.BATCHES_PER_DAY).astype('timedelta64[D]')
+        batch_start = (batch_dates + self.rng.integers(0, 24, size=n_batches)
+                       .astype('timedelta64[h]')).astype('datetime64[ns]')
+        total_duration = sum(s['duration_min'] for s in self.PROCESS_STEPS)
+        batch_end = batch_start + (total_duration + self.rng.integers(-20, 60, size=n_batches)
+                                   ).astype('timedelta64[m]')
+
+        batch_numbers = np.arange(1, n_batches + 1)
+        years = pd.DatetimeIndex(batch_dates).year
+        df = pd.DataFrame({
+            'batch_id': np.char.mod('B%06d', batch_numbers),
+            'lot_number': np.char.add(np.char.mod('LOT_%d_', years), np.char.mod('%04d', batch_numbers)),
+            'recipe': self.rng.choice(['CMOS_28nm_v3', 'FinFET_14nm_v2', 'GAA_7nm_v1'], size=n_batches),
+            'start_time': batch_start,
+            'end_time': batch_end,
+            'equipment_sequence': equipment_sequence,
+            'wafer_count': self.WAFERS_PER_BATCH
+        })
+        output_path = self.output_dir / 'raw' / 'wafer_batches.parquet'
+        df.to_parquet(output_path, compression='snappy')
         print(f"✓ Generated {len(df):,} wafer batches → {output_path}")
         return df
     
@@ -152,59 +182,73 @@ class SemiconductorDataGenerator:
         """Generate wafer test results"""
         print("Generating test results...")
         
-        test_results = []
-        
-        for _, batch in batches_df.iterrows():
-            # Batch-level yield factor (some batches inherently better)
-            batch_yield_factor = np.random.normal(0.95, 0.05)
-            batch_yield_factor = np.clip(batch_yield_factor, 0.70, 0.99)
-            
-            equipment_seq = batch['equipment_sequence'].split(',')
-            
-            for wafer_num in range(1, self.WAFERS_PER_BATCH + 1):
-                wafer_id = f"{batch['batch_id']}_W{wafer_num:02d}"
-                
-                # Position effect (edge wafers have lower yield)
-                position_effect = 1.0 if 5 <= wafer_num <= 20 else 0.95
-                
-                # Process each step
-                current_time = batch['start_time']
-                
-                for step_idx, step in enumerate(self.PROCESS_STEPS):
-                    step_start = current_time
-                    step_duration = step['duration_min'] + np.random.randint(-5, 10)
-                    step_end = step_start + timedelta(minutes=step_duration)
-                    
-                    # Step success probability
-                    step_yield = batch_yield_factor * position_effect * np.random.uniform(0.98, 1.0)
-                    pass_fail = 'PASS' if np.random.random() < step_yield else 'FAIL'
-                    
-                    # If failed, subsequent steps may not happen or will also fail
-                    if pass_fail == 'FAIL' and step_idx < len(self.PROCESS_STEPS) - 1:
-                        if np.random.random() < 0.7:  # 70% chance to stop processing
-                            break
-                    
-                    defect_density = np.random.exponential(0.5) if pass_fail == 'FAIL' else np.random.exponential(0.1)
-                    
-                    test_results.append({
-                        'wafer_id': wafer_id,
-                        'batch_id': batch['batch_id'],
-                        'process_step_id': step['step_id'],
-                        'process_step_name': step['name'],
-                        'equipment_id': equipment_seq[step_idx],
-                        'start_time': step_start,
-                        'end_time': step_end,
-                        'pass_fail': pass_fail,
-                        'defect_density': round(defect_density, 3),
-                        'bin_code': np.random.choice(['BIN1', 'BIN2', 'BIN3', 'BINX']) if pass_fail == 'PASS' else 'FAIL',
-                        'test_timestamp': step_end
-                    })
-                    
-                    current_time = step_end
-        
-        df = pd.DataFrame(test_results)
-        output_path = self.output_dir / 'raw' / 'test_results.csv'
-        df.to_csv(output_path, index=False)
+        n_batches = len(batches_df)
+        n_steps = len(self.PROCESS_STEPS)
+        n_wafers = n_batches * self.WAFERS_PER_BATCH
+        n_rows = n_wafers * n_steps  # one row per (batch, wafer, step) before break-on-fail
+
+        batch_ids = batches_df['batch_id'].to_numpy()
+        batch_starts = batches_df['start_time'].to_numpy(dtype='datetime64[ns]')
+        equipment_matrix = np.array(batches_df['equipment_sequence'].str.split(',').tolist())
+
+        # Flat index arrays over the (batch, wafer, step) grid
+        wafer_num = np.tile(np.repeat(np.arange(1, self.WAFERS_PER_BATCH + 1), n_steps), n_batches)
+        step_ids = np.tile(np.array([s['step_id'] for s in self.PROCESS_STEPS]), n_wafers)
+        step_pos = np.tile(np.arange(n_steps), n_wafers)
+
+        # Batch-level yield factor (some batches inherently better)
+        batch_yield_factor = self.rng.normal(0.95, 0.05, size=n_batches).clip(0.70, 0.99)
+
+        # Position effect (edge wafers have lower yield)
+        position_effect = np.where((wafer_num >= 5) & (wafer_num <= 20), 1.0, 0.95)
+
+        # Step success probability
+        step_yield = (np.repeat(batch_yield_factor, self.WAFERS_PER_BATCH * n_steps)
+                      * position_effect * self.rng.uniform(0.98, 1.0, size=n_rows))
+        passed = self.rng.random(n_rows) < step_yield
+
+        # If failed, subsequent steps may not happen: a wafer stops with 70%
+        # probability after a non-final FAIL, so keep only the rows before the
+        # first stop within each (batch, wafer) group
+        stop = ~passed & (self.rng.random(n_rows) < 0.7) & (step_pos < n_steps - 1)
+        stop_2d = stop.reshape(n_wafers, n_steps)
+        keep = np.ones((n_wafers, n_steps), dtype=bool)
+        keep[:, 1:] = np.cumsum(stop_2d[:, :-1], axis=1) == 0
+        keep = keep.ravel()
+
+        # Step timings: per-wafer cumulative durations from the batch start
+        base_durations = np.tile(np.array([s['duration_min'] for s in self.PROCESS_STEPS]), n_wafers)
+        durations = (base_durations + self.rng.integers(-5, 10, size=n_rows)).reshape(n_wafers, n_steps)
+        end_offsets = np.cumsum(durations, axis=1)
+        start_offsets = end_offsets - durations
+        row_batch_start = np.repeat(batch_starts, self.WAFERS_PER_BATCH * n_steps)
+        start_times = row_batch_start + start_offsets.ravel().astype('timedelta64[m]')
+        end_times = row_batch_start + end_offsets.ravel().astype('timedelta64[m]')
+
+        defect_density = np.where(passed,
+                                  self.rng.exponential(0.1, size=n_rows),
+                                  self.rng.exponential(0.5, size=n_rows)).round(3)
+        bin_code = np.where(passed,
+                            self.rng.choice(['BIN1', 'BIN2', 'BIN3', 'BINX'], size=n_rows),
+                            'FAIL')
+
+        row_batch_id = np.repeat(batch_ids, self.WAFERS_PER_BATCH * n_steps)
+        df = pd.DataFrame({
+            'wafer_id': np.char.add(row_batch_id, np.char.mod('_W%02d', wafer_num)),
+            'batch_id': row_batch_id,
+            'process_step_id': step_ids,
+            'process_step_name': np.tile(np.array([s['name'] for s in self.PROCESS_STEPS]), n_wafers),
+            'equipment_id': np.repeat(equipment_matrix, self.WAFERS_PER_BATCH, axis=0).ravel(),
+            'start_time': start_times,
+            'end_time': end_times,
+            'pass_fail': np.where(passed, 'PASS', 'FAIL'),
+            'defect_density': defect_density,
+            'bin_code': bin_code,
+            'test_timestamp': end_times
+        })
+        df = df.loc[keep].reset_index(drop=True)
+        output_path = self.output_dir / 'raw' / 'test_results.parquet'
+        df.to_parquet(output_path, compression='snappy')
         print(f"✓ Generated {len(df):,} test records → {output_path}")
         return df
     
@@ -212,53 +256,53 @@ class SemiconductorDataGenerator:
         """Generate equipment maintenance events"""
         print("Generating maintenance events...")
         
-        maintenance_events = []
-        
-        for eq_id in self.equipment['equipment_id']:
-            # Get equipment logs for this tool
-            eq_logs = equipment_logs_df[equipment_logs_df['equipment_id'] == eq_id].sort_values('event_timestamp')
-            
-            if len(eq_logs) == 0:
-                continue
-            
-            # Schedule preventive maintenance every 7-14 days
-            current_time = eq_logs['event_timestamp'].min()
-            end_time = eq_logs['event_timestamp'].max()
-            
-            while current_time < end_time:
-                # Preventive maintenance
-                pm_interval = np.random.randint(7, 14)
-                current_time += timedelta(days=pm_interval)
-                
-                if current_time > end_time:
-                    break
-                
-                maintenance_events.append({
-                    'event_id': f"PM_{eq_id}_{current_time.strftime('%Y%m%d')}",
-                    'equipment_id': eq_id,
-                    'event_type': 'PREVENTIVE',
-                    'event_timestamp': current_time,
-                    'duration_hours': np.random.randint(2, 8),
-                    'parts_replaced': np.random.choice(['Chamber cleaning', 'Filter replacement', 'Calibration', 'None']),
-                    'technician_id': f"TECH{np.random.randint(1, 20):02d}"
-                })
-            
-            # Add some corrective maintenance based on ALARM/DOWN events
-            problem_logs = eq_logs[eq_logs['status'].isin(['ALARM', 'DOWN'])]
-            for _, log in problem_logs.sample(min(len(problem_logs), 5)).iterrows():  # Sample up to 5 issues
-                maintenance_events.append({
-                    'event_id': f"CM_{eq_id}_{log['event_timestamp'].strftime('%Y%m%d%H%M')}",
-                    'equipment_id': eq_id,
-                    'event_type': 'CORRECTIVE',
-                    'event_timestamp': log['event_timestamp'] + timedelta(hours=np.random.randint(1, 4)),
-                    'duration_hours': np.random.randint(1, 24),
-                    'parts_replaced': np.random.choice(['Pump replacement', 'Sensor calibration', 'Software update', 'Valve repair']),
-                    'technician_id': f"TECH{np.random.randint(1, 20):02d}"
-                })
-        
-        df = pd.DataFrame(maintenance_events)
-        output_path = self.output_dir / 'raw' / 'maintenance_events.csv'
-        df.to_csv(output_path, index=False)
+        # Preventive maintenance every 7-14 days: draw enough intervals to
+        # cover the window for every equipment at once, cumsum them, and keep
+        # the events that land before each equipment's last log
+        bounds = equipment_logs_df.groupby('equipment_id', sort=False)['event_timestamp'].agg(['min', 'max'])
+        max_intervals = self.days // 7 + 1
+        intervals = self.rng.integers(7, 14, size=(len(bounds), max_intervals))
+        pm_times = (bounds['min'].to_numpy()[:, None]
+                    + np.cumsum(intervals, axis=1).astype('timedelta64[D]'))
+        pm_mask = (pm_times <= bounds['max'].to_numpy()[:, None]).ravel()
+
+        pm_equipment = np.repeat(bounds.index.to_numpy().astype(str), max_intervals)[pm_mask]
+        pm_times = pm_times.ravel()[pm_mask]
+        n_pm = len(pm_times)
+        pm_events = pd.DataFrame({
+            'event_id': np.char.add(np.char.add('PM_', pm_equipment),
+                                    pd.DatetimeIndex(pm_times).strftime('_%Y%m%d').to_numpy().astype(str)),
+            'equipment_id': pm_equipment,
+            'event_type': 'PREVENTIVE',
+            'event_timestamp': pm_times,
+            'duration_hours': self.rng.integers(2, 8, size=n_pm),
+            'parts_replaced': self.rng.choice(['Chamber cleaning', 'Filter replacement', 'Calibration', 'None'], size=n_pm),
+            'technician_id': np.char.mod('TECH%02d', self.rng.integers(1, 20, size=n_pm))
+        })
+
+        # Corrective maintenance: sample up to 5 ALARM/DOWN logs per equipment
+        # by shuffling the problem rows once and taking each group's head,
+        # instead of re-scanning the log frame per equipment
+        problem_logs = equipment_logs_df.loc[equipment_logs_df['status'].isin(['ALARM', 'DOWN'])]
+        sampled = (problem_logs.sample(frac=1, random_state=self.rng)
+                   .groupby('equipment_id', sort=False).head(5))
+        cm_equipment = sampled['equipment_id'].to_numpy().astype(str)
+        log_times = pd.DatetimeIndex(sampled['event_timestamp'])
+        n_cm = len(sampled)
+        cm_events = pd.DataFrame({
+            'event_id': np.char.add(np.char.add('CM_', cm_equipment),
+                                    log_times.strftime('_%Y%m%d%H%M').to_numpy().astype(str)),
+            'equipment_id': cm_equipment,
+            'event_type': 'CORRECTIVE',
+            'event_timestamp': log_times.to_numpy() + self.rng.integers(1, 4, size=n_cm).astype('timedelta64[h]'),
+            'duration_hours': self.rng.integers(1, 24, size=n_cm),
+            'parts_replaced': self.rng.choice(['Pump replacement', 'Sensor calibration', 'Software update', 'Valve repair'], size=n_cm),
+            'technician_id': np.char.mod('TECH%02d', self.rng.integers(1, 20, size=n_cm))
+        })
+
+        df = pd.concat([pm_events, cm_events], ignore_index=True)
+        output_path = self.output_dir / 'raw' / 'maintenance_events.parquet'
+        df.to_parquet(output_path, compression='snappy')
         print(f"✓ Generated {len(df):,} maintenance events → {output_path}")
         return df
     
@@ -273,13 +317,13 @@ class SemiconductorDataGenerator:
         print("="*60 + "\n")
         
         # Generate equipment master data
-        eq_output = self.output_dir / 'raw' / 'equipment_master.csv'
-        self.equipment.to_csv(eq_output, index=False)
+        eq_output = self.output_dir / 'raw' / 'equipment_master.parquet'
+        self.equipment.to_parquet(eq_output, compression='snappy')
         print(f"✓ Generated {len(self.equipment)} equipment records → {eq_output}")
         
         # Generate process steps
-        ps_output = self.output_dir / 'raw' / 'process_steps.csv'
-        pd.DataFrame(self.PROCESS_STEPS).to_csv(ps_output, index=False)
+        ps_output = self.output_dir / 'raw' / 'process_steps.parquet'
+        pd.DataFrame(self.PROCESS_STEPS).to_parquet(ps_output, compression='snappy')
         print(f"✓ Generated {len(self.PROCESS_STEPS)} process steps → {ps_output}\n")
         
         # Generate time-series data